@@ -18,36 +18,101 @@ import json
 import urllib.request
 import tarfile
 import shutil
-import re
+import stat
 import time
-from bpy.props import StringProperty, CollectionProperty, BoolProperty, IntProperty, PointerProperty
+import collections
+import threading
+from functools import lru_cache
+from bpy.props import StringProperty, PointerProperty
 from bpy.types import Operator, Panel, PropertyGroup
+from bpy.app.handlers import persistent
 
-def get_audio_tracks(video_path):
-    """Scan video file for audio tracks using ffprobe"""
+try:
+    # Faster JSON decoding if orjson is available in Blender's Python, json.loads accepts bytes as well
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Bytes of FFmpeg stderr kept for error reporting
+_STDERR_TAIL_SIZE = 4096
+
+# Attempts and initial delay in seconds for starting FFmpeg when the OS reports a transient error
+_SPAWN_ATTEMPTS = 3
+_SPAWN_RETRY_DELAY = 0.2
+
+# FFmpeg/ffprobe executables, resolved to absolute paths once in register()
+_FFMPEG = "ffmpeg"
+_FFPROBE = "ffprobe"
+
+# Constant parts of the FFmpeg/ffprobe command lines
+_FFPROBE_ARGS = ("-v", "error")
+_FFMPEG_QUIET_ARGS = ("-nostats", "-loglevel", "error")
+_FFMPEG_PROGRESS_ARGS = ("-progress", "pipe:1")
+_PCM_COPY_ARGS = ("-c:a", "copy", "-f", "wav")
+_FLAC_ARGS = ("-c:a", "flac", "-compression_level", "0", "-sample_fmt", "s16")
+_RESAMPLE_ARGS = ("-ar", "48000")
+
+# Containers that describe all streams in their header, ffmpeg doesn't need to read far into
+# these to find stream parameters, so its input analysis can be capped (1 MB / 1 second)
+_HEADER_INDEXED_FORMATS = {"matroska", "webm", "mov", "mp4"}
+_FFMPEG_SHORT_PROBE_ARGS = ("-probesize", "1M", "-analyzeduration", "1M")
+
+def probe_source(video_path):
+    """Scan video file for audio tracks, duration and video frame rate using a single ffprobe run"""
     command = [
-        "ffprobe", "-v", "error", "-select_streams", "a",
-        "-show_entries", "stream=index,duration,codec_name,channels,sample_rate:stream_tags=title",
+        _FFPROBE, *_FFPROBE_ARGS,
+        "-show_entries", "stream=index,codec_type,duration,codec_name,channels,sample_rate,r_frame_rate:stream_tags=title:format=duration,format_name",
         "-of", "json", video_path
     ]
 
     try:
         result = subprocess.run(
             command,
-            capture_output=True, text=True, check=False,
+            capture_output=True, check=False,
             timeout=30
         )
         
         if result.returncode != 0:
-            error_detail = f"ffprobe failed (code {result.returncode}): {result.stderr.strip()}"
+            error_detail = f"ffprobe failed (code {result.returncode}): {result.stderr.decode(errors='replace').strip()}"
             return {"error": "ffprobe_failed", "detail": error_detail}
 
         if not result.stdout.strip():
             error_detail = "ffprobe returned no output. File may not contain audio tracks."
             return {"error": "ffprobe_empty_output", "detail": error_detail}
 
-        data = json.loads(result.stdout)
-        return data.get("streams", [])
+        # Raw bytes go straight to the decoder, no text decoding step needed
+        data = _json_loads(result.stdout)
+        streams = data.get("streams", [])
+
+        audio_streams = [s for s in streams if s.get("codec_type") == "audio"]
+
+        try:
+            format_duration = float(data.get("format", {}).get("duration"))
+        except (TypeError, ValueError):
+            format_duration = None
+
+        # Parse frame rate of the first video stream (could be in format like "30/1" or "29.97")
+        video_fps = None
+        video_stream = next((s for s in streams if s.get("codec_type") == "video"), None)
+        if video_stream:
+            fps_string = video_stream.get("r_frame_rate", "")
+            try:
+                if '/' in fps_string:
+                    # Handle fractional format like "30/1" or "30000/1001" 
+                    numerator, denominator = fps_string.split('/')
+                    video_fps = float(numerator) / float(denominator)
+                else:
+                    video_fps = float(fps_string)
+            except (ValueError, ZeroDivisionError):
+                video_fps = None
+
+        return {
+            "audio_streams": audio_streams,
+            "format_duration": format_duration,
+            "format_name": data.get("format", {}).get("format_name", ""),
+            "video_fps": video_fps,
+        }
 
     except json.JSONDecodeError as e:
         error_detail = f"Error parsing ffprobe output: {e}"
@@ -55,78 +120,240 @@ def get_audio_tracks(video_path):
     except subprocess.TimeoutExpired:
         error_detail = "ffprobe timed out after 30 seconds"
         return {"error": "ffprobe_timeout", "detail": error_detail}
+    except FileNotFoundError:
+        error_detail = "ffprobe not found. Install FFmpeg and make sure ffprobe is on PATH."
+        return {"error": "ffprobe_not_found", "detail": error_detail}
+    except OSError as e:
+        error_detail = f"Could not run ffprobe: {e}"
+        return {"error": "ffprobe_os_error", "detail": error_detail}
     except Exception as e:
         error_detail = f"Unexpected error running ffprobe: {e}"
         return {"error": "ffprobe_unexpected_error", "detail": error_detail}
 
-def run_ffmpeg_with_progress(command, timeout, duration_seconds=None, operation_name="FFmpeg"):
-    """Run FFmpeg command with progress monitoring and update Blender's progress bar"""
-    wm = bpy.context.window_manager
+class _ProbeFailed(Exception):
+    """Carries a failed probe result out of _cached_probe, so lru_cache does not store it"""
     
+    def __init__(self, probe_info):
+        super().__init__(probe_info["detail"])
+        self.probe_info = probe_info
+
+@lru_cache(maxsize=64)
+def _cached_probe(path, mtime_ns, size):
+    """Probe result cache, keyed on file modification time and size so edited files get re-probed"""
+    probe_info = probe_source(path)
+    if "error" in probe_info:
+        raise _ProbeFailed(probe_info)
+    return probe_info
+
+def probe_source_cached(video_path, file_stat=None):
+    """Probe video file, reusing the result of an earlier probe if the file did not change"""
+    if file_stat is None:
+        file_stat = os.stat(video_path)
     try:
-        # Start the process
-        process = subprocess.Popen(
-            command,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            universal_newlines=True,
-            bufsize=1
-        )
+        return _cached_probe(video_path, file_stat.st_mtime_ns, file_stat.st_size)
+    except _ProbeFailed as e:
+        # Failures (timeouts, missing ffprobe) are retried on the next call instead of sticking to the file
+        return e.probe_info
+
+def _stat_or_none(path):
+    """Stat a regular file in one syscall, covering both os.path.isfile() and os.path.getsize(), None if it doesn't exist"""
+    try:
+        file_stat = os.stat(path)
+    except OSError:
+        return None
+    return file_stat if stat.S_ISREG(file_stat.st_mode) else None
+
+# PCM codecs the WAV muxer accepts as-is and their bytes per sample, these can be stream copied instead of re-encoded
+_WAV_COMPATIBLE_PCM_CODECS = {"pcm_u8": 1, "pcm_s16le": 2, "pcm_s24le": 3, "pcm_s32le": 4, "pcm_f32le": 4, "pcm_f64le": 8}
+
+def get_audio_codec_args(stream_info, allow_copy=True):
+    """Build the FFmpeg audio output arguments and file extension for a stream, avoiding needless decoding and resampling"""
+    codec = stream_info.get("codec_name")
+    source_sample_rate = str(stream_info.get("sample_rate", ""))
+
+    if allow_copy and codec in _WAV_COMPATIBLE_PCM_CODECS:
+        # Already PCM, copy the samples straight into the WAV container
+        return _PCM_COPY_ARGS, ".wav"
+
+    # Lossless FLAC at the fastest compression level, about half the size of 16-bit PCM WAV
+    if source_sample_rate != "48000":
+        return _FLAC_ARGS + _RESAMPLE_ARGS, ".flac"  # Resample to standard sample rate
+    return _FLAC_ARGS, ".flac"
+
+def get_extracted_duration(temp_path, stream_info, file_size):
+    """Duration in seconds of an extracted WAV/FLAC file, read from the file itself instead of running ffprobe"""
+    if temp_path.endswith(".flac"):
+        # STREAMINFO follows the 4 byte "fLaC" marker and a 4 byte block header. After 10 bytes of
+        # block/frame sizes come 20 bits sample rate, 3 bits channels, 5 bits sample size, 36 bits sample count
+        with open(temp_path, "rb") as f:
+            header = f.read(26)
+        if len(header) < 26 or header[:4] != b"fLaC":
+            return None
+        stream_info_bits = int.from_bytes(header[18:26], "big")
+        sample_rate = stream_info_bits >> 44
+        total_samples = stream_info_bits & ((1 << 36) - 1)
+        if not sample_rate or not total_samples:
+            return None
+        return total_samples / sample_rate
+
+    # Stream copied PCM WAV, size is the 44 byte header plus the raw samples
+    bytes_per_sample = _WAV_COMPATIBLE_PCM_CODECS[stream_info["codec_name"]]
+    frame_size = int(stream_info["sample_rate"]) * int(stream_info["channels"]) * bytes_per_sample
+    return max(0, file_size - 44) / frame_size
+
+class FFmpegJob:
+    """FFmpeg process that is monitored without blocking, so it can be driven from a modal operator's timer"""
+    
+    def __init__(self, command, timeout, duration_seconds=None):
+        self.timeout = timeout
+        self.duration_seconds = duration_seconds
+        self.progress = 0.0  # Fraction of duration_seconds processed so far
+        self.error = None  # Set if FFmpeg failed or timed out
+        # Progress parsed by the reader thread, picked up by poll() on the main thread. Only the
+        # newest value matters, so older ones are dropped instead of piling up while Blender is busy
+        self._progress_updates = collections.deque(maxlen=1)
+        self._reader = None
+        
+        # Errors go to a temporary file so a full pipe can never stall FFmpeg
+        self._stderr_file = tempfile.TemporaryFile()
         
-        start_time = time.time()
-        last_progress = 0
+        report_progress = bool(duration_seconds)
+        if report_progress:
+            # Have FFmpeg write key=value progress records to stdout
+            command = [command[0], *_FFMPEG_QUIET_ARGS, *_FFMPEG_PROGRESS_ARGS, *command[1:]]
+        else:
+            command = [command[0], *_FFMPEG_QUIET_ARGS, *command[1:]]
+        
+        try:
+            self.process = self._spawn(command, subprocess.PIPE if report_progress else subprocess.DEVNULL)
+        except Exception:
+            self._stderr_file.close()
+            raise
         
-        # Monitor the process
-        while process.poll() is None:
-            # Check for timeout
-            if time.time() - start_time > timeout:
-                process.terminate()
-                process.wait(timeout=5)
-                return None, "Process timed out"
-            
-            # Read stderr for progress (FFmpeg outputs progress to stderr)
+        self._start_time = time.time()
+        if report_progress:
+            # Blocking reads happen on a background thread, so the main thread never waits on FFmpeg
+            self._reader = threading.Thread(target=self._read_progress, daemon=True)
+            self._reader.start()
+    
+    def _spawn(self, command, stdout):
+        # Transient OS errors (e.g. EAGAIN when out of process slots) are retried with a growing delay,
+        # a missing FFmpeg binary will not appear by waiting, so FileNotFoundError is raised right away
+        delay = _SPAWN_RETRY_DELAY
+        for attempt in range(_SPAWN_ATTEMPTS):
             try:
-                line = process.stderr.readline()
-                if line:
-                    # Parse FFmpeg progress output
-                    # Look for time= patterns
-                    time_match = re.search(r'time=(\d{2}):(\d{2}):(\d{2}\.\d{2})', line)
-                    if time_match and duration_seconds:
-                        hours = int(time_match.group(1))
-                        minutes = int(time_match.group(2))
-                        seconds = float(time_match.group(3))
-                        current_time = hours * 3600 + minutes * 60 + seconds
-                        
-                        progress = min(current_time / duration_seconds, 1.0)
-                        
-                        # Only update if progress increased significantly (avoid spam)
-                        if progress - last_progress > 0.01:
-                            wm.progress_update(progress)
-                            last_progress = progress
-                            
-            except:
-                # Continue even if progress parsing fails
-                pass
-            
-            # Small delay to prevent excessive CPU usage
-            time.sleep(0.1)
+                return subprocess.Popen(command, stdout=stdout, stderr=self._stderr_file)
+            except FileNotFoundError:
+                raise
+            except OSError:
+                if attempt == _SPAWN_ATTEMPTS - 1:
+                    raise
+                time.sleep(delay)
+                delay *= 2
+    
+    def poll(self):
+        """Pick up progress reported so far without blocking, returns True once FFmpeg has finished"""
+        exited = self.process.poll() is not None
         
-        # Get final output
-        stdout, stderr = process.communicate()
+        if not exited:
+            self._drain_progress()
+            if time.time() - self._start_time > self.timeout:
+                self.cancel()
+                self.error = "Process timed out"
+                return True
+            return False
         
-        if process.returncode == 0:
-            return stdout, None
-        else:
-            return None, stderr
-            
-    except Exception as e:
-        return None, str(e)
+        if self.process.returncode != 0:
+            # Keep the exit code next to the message, it tells a decode failure apart from e.g. a full disk
+            stderr_tail = self._read_stderr_tail()
+            self.error = f"FFmpeg exited with code {self.process.returncode}"
+            if stderr_tail:
+                self.error += f": {stderr_tail}"
+        self._close()
+        self._drain_progress()
+        return True
+    
+    def cancel(self):
+        """Stop FFmpeg if it is still running"""
+        if self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+        self._close()
+    
+    def _drain_progress(self):
+        try:
+            self.progress = self._progress_updates.pop()
+        except IndexError:
+            # No new progress since the last poll
+            pass
+    
+    def _read_progress(self):
+        # Runs on the reader thread until FFmpeg closes stdout
+        for line in self.process.stdout:
+            # Parse FFmpeg progress records, one key=value pair per line
+            key, _, value = line.strip().partition(b"=")
+            # out_time_ms is the older name of out_time_us, both are in microseconds
+            if key not in (b"out_time_us", b"out_time_ms"):
+                continue
+            try:
+                current_time = int(value) / 1_000_000
+            except ValueError:
+                # "N/A" until the first packet is written
+                continue
+            self._progress_updates.append(min(current_time / self.duration_seconds, 1.0))
+    
+    def _read_stderr_tail(self):
+        # Only the tail of stderr is used, it holds the actual error message
+        self._stderr_file.seek(0, os.SEEK_END)
+        self._stderr_file.seek(max(0, self._stderr_file.tell() - _STDERR_TAIL_SIZE))
+        return self._stderr_file.read().decode(errors="replace").strip()
+    
+    def _close(self):
+        # FFmpeg has exited, so the reader thread sees EOF and finishes on its own
+        if self._reader is not None:
+            self._reader.join(timeout=5)
+            if not self._reader.is_alive():
+                self.process.stdout.close()
+        self._stderr_file.close()
+
+def scan_strips(seq_editor):
+    """Collect selected movie/sound strips and the highest occupied channel in one pass over all strips"""
+    selected_strips = []
+    max_channel = 0
+    
+    for strip in seq_editor.strips_all:
+        if strip.channel > max_channel:
+            max_channel = strip.channel
+        if strip.select and strip.type in {'MOVIE', 'SOUND'}:
+            if strip.type == 'MOVIE' or (hasattr(strip, 'sound') and strip.sound.filepath):
+                selected_strips.append(strip)
+    
+    return selected_strips, max_channel
 
-# Property group for each audio track (kept for compatibility)
-class AudioTrackItem(PropertyGroup):
-    index: StringProperty(name="Index")
-    name: StringProperty(name="Name")
-    selected: BoolProperty(name="Import", default=False)
+# Panel info per strip, keyed by strip.as_pointer(): (filepath, source_file, size_mb, exists, probe_info)
+_STRIP_INFO_CACHE = {}
+
+def get_strip_source_info(strip, filepath):
+    """Resolve a strip's source file, its size and probe result, cached between panel redraws"""
+    cached = _STRIP_INFO_CACHE.get(strip.as_pointer())
+    if cached is None or cached[0] != filepath:
+        source_file = bpy.path.abspath(filepath)
+        source_stat = _stat_or_none(source_file)
+        exists = source_stat is not None
+        file_size_mb = source_stat.st_size / (1024 * 1024) if exists else 0.0
+        probe_info = probe_source_cached(source_file, source_stat) if exists else None
+        cached = (filepath, source_file, file_size_mb, exists, probe_info)
+        _STRIP_INFO_CACHE[strip.as_pointer()] = cached
+    return cached[1:]
+
+@persistent
+def clear_strip_info_cache(scene, depsgraph):
+    """Drop cached panel info whenever the scene changes"""
+    _STRIP_INFO_CACHE.clear()
 
 # UI panel in the Video Sequence Editor
 class SEQUENCER_PT_MultiAudioImport(Panel):
@@ -145,12 +372,7 @@ class SEQUENCER_PT_MultiAudioImport(Panel):
             
         # Check for selected video strips
         seq_editor = context.scene.sequence_editor
-        selected_video_strips = []
-        
-        for strip in seq_editor.strips_all:
-            if strip.select and strip.type in ['MOVIE', 'SOUND']:
-                if strip.type == 'MOVIE' or (strip.type == 'SOUND' and hasattr(strip, 'sound') and strip.sound.filepath):
-                    selected_video_strips.append(strip)
+        selected_video_strips, _ = scan_strips(seq_editor)
         
         if not selected_video_strips:
             layout.label(text="Select a video strip", icon='INFO')
@@ -162,19 +384,25 @@ class SEQUENCER_PT_MultiAudioImport(Panel):
             
             # Get source file info
             if selected_strip.type == 'MOVIE':
-                source_file = bpy.path.abspath(selected_strip.filepath)
+                filepath = selected_strip.filepath
                 strip_type = "Video"
             else:  # SOUND
-                source_file = bpy.path.abspath(selected_strip.sound.filepath)
+                filepath = selected_strip.sound.filepath
                 strip_type = "Audio"
             
+            source_file, file_size_mb, source_exists, probe_info = get_strip_source_info(selected_strip, filepath)
+            
             # Display strip info
             layout.label(text=f"Selected: {selected_strip.name}", icon='SEQUENCE')
             layout.label(text=f"Type: {strip_type}")
             
-            if os.path.isfile(source_file):
-                file_size_mb = os.path.getsize(source_file) / (1024 * 1024)
+            if source_exists:
                 layout.label(text=f"Size: {file_size_mb:.1f} MB")
+                
+                if "error" in probe_info:
+                    layout.label(text="Could not scan audio tracks", icon='ERROR')
+                else:
+                    layout.label(text=f"Audio tracks: {len(probe_info['audio_streams'])}")
                 layout.separator()
                 layout.operator("multi_audio.extract_additional_tracks", 
                               icon="SPEAKER", 
@@ -191,8 +419,19 @@ class AUDIO_OT_ExtractAdditionalTracks(Operator):
     bl_idname = "multi_audio.extract_additional_tracks"
     bl_label = "Extract Additional Audio Tracks"
     bl_description = "Extract additional audio tracks from the selected video/audio strip and create a metastrip"
+    
+    # Set while an extraction runs in the background, a second run would write the same files
+    _job_running = False
+    
+    @classmethod
+    def poll(cls, context):
+        return not cls._job_running
 
     def execute(self, context):
+        # Informational messages are collected and reported at once when the operator ends,
+        # warnings and errors are still reported immediately
+        self._info_log = []
+        
         # Check sequence editor
         if not context.scene.sequence_editor:
             self.report({'ERROR'}, "No sequence editor available.")
@@ -201,54 +440,56 @@ class AUDIO_OT_ExtractAdditionalTracks(Operator):
         seq_editor = context.scene.sequence_editor
         
         # Find selected video/audio strip
-        selected_strip = None
-        for strip in seq_editor.strips_all:
-            if strip.select and strip.type in ['MOVIE', 'SOUND']:
-                if strip.type == 'MOVIE' or (strip.type == 'SOUND' and hasattr(strip, 'sound') and strip.sound.filepath):
-                    if selected_strip is None:
-                        selected_strip = strip
-                    else:
-                        self.report({'ERROR'}, "Multiple strips selected. Please select only one video/audio strip.")
-                        return {'CANCELLED'}
+        selected_strips, _ = scan_strips(seq_editor)
         
-        if not selected_strip:
+        if len(selected_strips) > 1:
+            self.report({'ERROR'}, "Multiple strips selected. Please select only one video/audio strip.")
+            return {'CANCELLED'}
+        
+        if not selected_strips:
             self.report({'ERROR'}, "No video or audio strip selected.")
             return {'CANCELLED'}
         
+        selected_strip = selected_strips[0]
+        
         # Get source file path
         if selected_strip.type == 'MOVIE':
             source_file = bpy.path.abspath(selected_strip.filepath)
         else:  # SOUND
             source_file = bpy.path.abspath(selected_strip.sound.filepath)
         
-        if not os.path.isfile(source_file):
+        source_stat = _stat_or_none(source_file)
+        if source_stat is None:
             self.report({'ERROR'}, f"Source file not found: {source_file}")
             return {'CANCELLED'}
 
         # Initialize progress bar
         wm = context.window_manager
         wm.progress_begin(0, 100)
+        running_modal = False
+        self._job = None
+        self._timer = None
         
         try:
             # Phase 1: Scan for audio tracks (10% of progress)
             wm.progress_update(10)
-            self.report({'INFO'}, f"Scanning audio tracks in: {os.path.basename(source_file)}")
-            found_audio_info = get_audio_tracks(source_file)
+            self._info_log.append(f"Scanning audio tracks in: {os.path.basename(source_file)}")
+            probe_info = probe_source_cached(source_file, source_stat)
 
-            if isinstance(found_audio_info, dict) and "error" in found_audio_info:
-                self.report({'ERROR'}, f"Failed to scan audio tracks: {found_audio_info['detail']}")
+            if "error" in probe_info:
+                self.report({'ERROR'}, f"Failed to scan audio tracks: {probe_info['detail']}")
                 return {'CANCELLED'}
             
-            found_audio_streams = found_audio_info
+            found_audio_streams = probe_info["audio_streams"]
             
             if not found_audio_streams:
-                self.report({'INFO'}, "No audio tracks found in source file.")
+                self._info_log.append("No audio tracks found in source file.")
                 return {'FINISHED'}
             elif len(found_audio_streams) <= 1:
-                self.report({'INFO'}, f"Only {len(found_audio_streams)} audio track found. No additional tracks to extract.")
+                self._info_log.append(f"Only {len(found_audio_streams)} audio track found. No additional tracks to extract.")
                 return {'FINISHED'}
             else:
-                self.report({'INFO'}, f"Found {len(found_audio_streams)} audio tracks. Extracting additional tracks...")
+                self._info_log.append(f"Found {len(found_audio_streams)} audio tracks. Extracting additional tracks...")
                 
                 # Log detailed information about each track found
                 for i, stream_info in enumerate(found_audio_streams):
@@ -260,7 +501,7 @@ class AUDIO_OT_ExtractAdditionalTracks(Operator):
                     stream_tags = stream_info.get("tags", {})
                     stream_title = stream_tags.get("title", f"Track_{stream_index}")
                     
-                    self.report({'INFO'}, f"Track {i}: index={stream_index}, name={stream_title}, duration={stream_duration}s, codec={stream_codec}, channels={stream_channels}, sample_rate={stream_sample_rate}")
+                    self._info_log.append(f"Track {i}: index={stream_index}, name={stream_title}, duration={stream_duration}s, codec={stream_codec}, channels={stream_channels}, sample_rate={stream_sample_rate}")
                     
                     # Warn about potential empty/silent tracks
                     if stream_duration and stream_duration != "unknown":
@@ -273,46 +514,24 @@ class AUDIO_OT_ExtractAdditionalTracks(Operator):
 
             # Phase 2: Analyze video properties for duration (20% of progress)
             wm.progress_update(20)
-            self.report({'INFO'}, "Getting source file duration...")
+            self._info_log.append("Getting source file duration...")
             try:
-                file_size_mb = os.path.getsize(source_file) / (1024 * 1024)
+                file_size_mb = source_stat.st_size / (1024 * 1024)
                 
-                # Get video duration
-                video_info_command = [
-                    "ffprobe", "-v", "error", 
-                    "-show_entries", "format=duration",
-                    "-of", "default=noprint_wrappers=1:nokey=1", source_file
-                ]
+                # Video duration was read by the same ffprobe run as the audio tracks
+                video_duration_seconds = probe_info["format_duration"]
                 
-                result = subprocess.run(video_info_command, capture_output=True, text=True, check=False, timeout=30)
-                
-                if result.returncode != 0 or not result.stdout.strip():
+                if video_duration_seconds is None:
                     self.report({'ERROR'}, f"Failed to get duration from source file")
                     return {'CANCELLED'}
                 
-                video_duration_seconds = float(result.stdout.strip())
-                self.report({'INFO'}, f"Source duration: {video_duration_seconds:.3f} seconds")
+                self._info_log.append(f"Source duration: {video_duration_seconds:.3f} seconds")
                 
                 # Get actual video FPS (crucial for accurate duration calculations)
-                video_fps_command = [
-                    "ffprobe", "-v", "error", "-select_streams", "v:0",
-                    "-show_entries", "stream=r_frame_rate",
-                    "-of", "default=noprint_wrappers=1:nokey=1", source_file
-                ]
+                actual_video_fps = probe_info["video_fps"]
                 
-                fps_result = subprocess.run(video_fps_command, capture_output=True, text=True, check=False, timeout=30)
-                
-                if fps_result.returncode == 0 and fps_result.stdout.strip():
-                    # Parse frame rate (could be in format like "30/1" or "29.97")
-                    fps_string = fps_result.stdout.strip()
-                    if '/' in fps_string:
-                        # Handle fractional format like "30/1" or "30000/1001" 
-                        numerator, denominator = fps_string.split('/')
-                        actual_video_fps = float(numerator) / float(denominator)
-                    else:
-                        actual_video_fps = float(fps_string)
-                    
-                    self.report({'INFO'}, f"Source video FPS: {actual_video_fps:.3f}")
+                if actual_video_fps:
+                    self._info_log.append(f"Source video FPS: {actual_video_fps:.3f}")
                 else:
                     # Fallback to project FPS if video FPS detection fails
                     scene = context.scene
@@ -326,228 +545,348 @@ class AUDIO_OT_ExtractAdditionalTracks(Operator):
             # Phase 3: Prepare for safe audio extraction (30% of progress)
             wm.progress_update(30)
             
-            # Store ALL original strip properties to preserve user's work
-            original_strip_name = selected_strip.name
-            original_strip_channel = selected_strip.channel
-            original_frame_start = selected_strip.frame_start
+            # Store ALL original strip properties to preserve user's work.
+            # The strip itself is looked up by name again once extraction finished,
+            # since the timeline may be edited while FFmpeg runs.
+            self._original_strip_name = selected_strip.name
+            self._original_strip_channel = selected_strip.channel
+            self._original_frame_start = selected_strip.frame_start
             original_frame_final_start = selected_strip.frame_final_start  
             original_frame_final_end = selected_strip.frame_final_end
-            original_frame_final_duration = selected_strip.frame_final_duration
-            original_frame_offset_start = getattr(selected_strip, 'frame_offset_start', 0)
-            original_frame_offset_end = getattr(selected_strip, 'frame_offset_end', 0)
+            self._original_frame_final_duration = selected_strip.frame_final_duration
+            self._original_frame_offset_start = getattr(selected_strip, 'frame_offset_start', 0)
+            self._original_frame_offset_end = getattr(selected_strip, 'frame_offset_end', 0)
+            self._found_audio_track_count = len(found_audio_streams)
+            
+            self._info_log.append(f"Original strip properties: start={self._original_frame_start}, final_start={original_frame_final_start}, final_end={original_frame_final_end}, duration={self._original_frame_final_duration}")
+            
+            self._info_log.append(f"Extracting all {len(found_audio_streams)} audio tracks safely...")
+            
+            additional_tracks = found_audio_streams[1:]  # Skip first track (will be included with original strip)
             
-            self.report({'INFO'}, f"Original strip properties: start={original_frame_start}, final_start={original_frame_final_start}, final_end={original_frame_final_end}, duration={original_frame_final_duration}")
+            # The per-track limit is kept, the single FFmpeg run encodes all additional tracks
+            audio_timeout = max(60, min(600, int(file_size_mb * 2))) * len(additional_tracks)
             
-            # If we have multiple audio tracks, extract them safely
-            if len(found_audio_streams) > 1:
-                self.report({'INFO'}, f"Extracting all {len(found_audio_streams)} audio tracks safely...")
+            # Phase 4: Extract additional audio tracks (30-80% of progress)
+            # Extract the exact duration requested by the user's video strip, since all audio
+            # tracks were recorded simultaneously and should have identical durations.
+            # All tracks are written by a single FFmpeg run so the container is demuxed only once.
+            
+            # Calculate precise duration from original strip's frame count
+            # Use actual video FPS instead of project FPS for accuracy
+            self._precise_duration_seconds = self._original_frame_final_duration / actual_video_fps
+            
+            # Calculate the exact start time in the source file
+            # This accounts for any trimming/offset the user has applied
+            strip_start_offset_seconds = self._original_frame_offset_start / actual_video_fps
+            
+            self._info_log.append(f"Strip offsets: frame_offset_start={self._original_frame_offset_start}, frame_offset_end={self._original_frame_offset_end}")
+            self._info_log.append(f"Using precise extraction: start={strip_start_offset_seconds:.3f}s, duration={self._precise_duration_seconds:.3f}s ({self._original_frame_final_duration} frames at {actual_video_fps:.2f} FPS)")
+            
+            # Save extracted audio next to original video file instead of temp directory
+            source_dir = os.path.dirname(source_file)
+            
+            # The streams are already known from ffprobe, skip most of FFmpeg's own input analysis where that is safe
+            if _HEADER_INDEXED_FORMATS.intersection(probe_info["format_name"].split(",")):
+                probe_args = _FFMPEG_SHORT_PROBE_ARGS
+            else:
+                probe_args = ()
+            
+            ffmpeg_command = [
+                _FFMPEG, "-y",
+                *probe_args,
+                "-ss", f"{strip_start_offset_seconds:.6f}",  # Seek BEFORE input for accuracy
+                "-i", source_file,
+            ]
+            self._extraction_outputs = []  # (stream_info, temp_path) for every output of the command
+            
+            for i, stream_info in enumerate(additional_tracks):
+                stream_index = str(stream_info.get("index"))
+                stream_tags = stream_info.get("tags", {})
+                stream_title = stream_tags.get("title", f"Track_{stream_index}")
+                stream_codec = stream_info.get("codec_name", "unknown")
                 
-                additional_tracks = found_audio_streams[1:]  # Skip first track (will be included with original strip)
+                # PCM sources are copied to WAV, everything else is decoded to FLAC.
+                # Stream copy only starts on a packet boundary, so it is limited to untrimmed strips.
+                codec_args, extension = get_audio_codec_args(stream_info, allow_copy=strip_start_offset_seconds == 0)
                 
-                audio_timeout = max(60, min(600, int(file_size_mb * 2)))
+                temp_audio_filename = f"additional_audio_{self._original_strip_name}_track_{stream_index}{extension}"
+                temp_path = os.path.join(source_dir, temp_audio_filename)
                 
-                # Find temporary extraction area - use a simple, predictable location
-                # Instead of calculating complex safe areas, use frame 1000+ for temporary extraction
-                temp_extraction_start = 1000
+                self._info_log.append(f"Queueing additional audio track {stream_index} ('{stream_title}', {stream_codec}) [{i+1}/{len(additional_tracks)}]...")
                 
-                self.report({'INFO'}, f"Using temporary extraction area starting at frame {temp_extraction_start}")
+                # One output per track
+                ffmpeg_command += [
+                    "-map", f"0:{stream_index}",
+                    "-vn",  # No video output
+                    *codec_args,
+                    "-t", f"{self._precise_duration_seconds:.6f}",
+                    temp_path
+                ]
+                self._extraction_outputs.append((stream_info, temp_path))
+            
+            # Debug: Show the exact FFmpeg command
+            cmd_str = ' '.join(ffmpeg_command)
+            self._info_log.append(f"FFmpeg command: {cmd_str}")
+            
+            self._info_log.append(f"Extracting {len(self._extraction_outputs)} additional audio tracks in a single pass...")
+            self._job = FFmpegJob(ffmpeg_command, audio_timeout, self._precise_duration_seconds)
+            self._last_progress = 30
+            # The user may switch scenes while FFmpeg runs, the strip is looked up in this one afterwards
+            self._scene_name = context.scene.name
+            
+            # Let FFmpeg run in the background, modal() checks on it from a timer so the UI stays responsive
+            self._timer = wm.event_timer_add(0.1, window=context.window)
+            wm.modal_handler_add(self)
+            running_modal = True
+            AUDIO_OT_ExtractAdditionalTracks._job_running = True
+            return {'RUNNING_MODAL'}
+        
+        except FileNotFoundError:
+            self.report({'ERROR'}, "FFmpeg not found. Install FFmpeg and make sure it is on PATH.")
+            return {'CANCELLED'}
+        except OSError as e:
+            self.report({'ERROR'}, f"Could not start FFmpeg: {e}")
+            return {'CANCELLED'}
+        except Exception as e:
+            self.report({'ERROR'}, f"Failed to extract additional audio tracks: {e}")
+            return {'CANCELLED'}
+        finally:
+            # Always end progress bar, unless the modal part of the operator still needs it
+            if not running_modal:
+                # Starting the modal part failed after FFmpeg was spawned, don't leave it running
+                if self._job is not None:
+                    self.cancel_job()
+                if self._timer is not None:
+                    wm.event_timer_remove(self._timer)
+                wm.progress_end()
+                self.flush_info_log()
+    
+    def modal(self, context, event):
+        if event.type == 'ESC':
+            self.cancel_job()
+            self.report({'WARNING'}, "Audio track extraction cancelled")
+            self.end_modal(context)
+            return {'CANCELLED'}
+        
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+        
+        try:
+            if not self._job.poll():
+                # Only touch the progress bar when it moves by a whole percent, every update redraws the header
+                progress = 30 + int(50 * self._job.progress)
+                if progress != self._last_progress:
+                    self._last_progress = progress
+                    context.window_manager.progress_update(progress)
+                return {'RUNNING_MODAL'}
+            
+            return self.import_extracted_tracks(context)
+        
+        except Exception as e:
+            self.cancel_job()
+            self.report({'ERROR'}, f"Failed to extract additional audio tracks: {e}")
+            self.end_modal(context)
+            return {'CANCELLED'}
+    
+    def cancel(self, context):
+        # Called by Blender instead of modal() when it drops the handler, e.g. on file load or window close
+        self.cancel_job()
+        self.end_modal(context)
+    
+    def cancel_job(self):
+        """Stop FFmpeg and delete the files it was writing, they are partial and never imported"""
+        self._job.cancel()
+        self.remove_extraction_outputs()
+    
+    def remove_extraction_outputs(self):
+        for _, temp_path in self._extraction_outputs:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                # Never written, or still locked by the OS
+                pass
+    
+    def end_modal(self, context):
+        wm = context.window_manager
+        wm.event_timer_remove(self._timer)
+        AUDIO_OT_ExtractAdditionalTracks._job_running = False
+        # Always end progress bar
+        wm.progress_end()
+        self.flush_info_log()
+    
+    def flush_info_log(self):
+        """Report all collected informational messages as a single entry"""
+        if self._info_log:
+            self.report({'INFO'}, '\n'.join(self._info_log))
+            self._info_log = []
+    
+    def import_extracted_tracks(self, context):
+        """Create sound strips for the extracted tracks and group them with the original strip into a metastrip"""
+        wm = context.window_manager
+        scene = bpy.data.scenes.get(self._scene_name)
+        seq_editor = scene.sequence_editor if scene else None
+        
+        try:
+            if self._job.error:
+                self.report({'WARNING'}, f"Failed to extract additional audio tracks: {self._job.error}")
+                # Outputs of a failed run may be partial, don't import them
+                self.remove_extraction_outputs()
+                extraction_outputs = []
+            else:
+                extraction_outputs = self._extraction_outputs
+            
+            wm.progress_update(80)
+            
+            selected_strip = seq_editor.strips_all.get(self._original_strip_name) if seq_editor else None
+            if not selected_strip:
+                self.remove_extraction_outputs()
+                self.report({'ERROR'}, f"Strip '{self._original_strip_name}' no longer exists.")
+                return {'CANCELLED'}
+            
+            # The audio was cut to the strip as it was when extraction started, the metastrip is placed from
+            # that snapshot too. If the strip was moved or trimmed since, the result would not line up.
+            if (selected_strip.frame_start != self._original_frame_start
+                    or selected_strip.channel != self._original_strip_channel
+                    or selected_strip.frame_final_duration != self._original_frame_final_duration
+                    or getattr(selected_strip, 'frame_offset_start', 0) != self._original_frame_offset_start
+                    or getattr(selected_strip, 'frame_offset_end', 0) != self._original_frame_offset_end):
+                self.remove_extraction_outputs()
+                self.report({'WARNING'}, f"Strip '{self._original_strip_name}' was moved or trimmed during extraction. Please extract again.")
+                return {'CANCELLED'}
+            
+            importable_tracks = []  # (stream_title, temp_path) of every extracted file that can be imported
+            
+            for stream_info, temp_path in extraction_outputs:
+                stream_index = str(stream_info.get("index"))
+                stream_tags = stream_info.get("tags", {})
+                stream_title = stream_tags.get("title", f"Track_{stream_index}")
                 
-                # Find available channels for extraction  
-                occupied_channels = [s.channel for s in seq_editor.strips_all]
-                if occupied_channels:
-                    max_channel = max(occupied_channels)
-                    extraction_start_channel = max_channel + 1
-                    self.report({'INFO'}, f"Found channels 1-{max_channel} occupied, using channel {extraction_start_channel}+ for extraction")
+                # Check the extracted file properties for debugging
+                temp_stat = _stat_or_none(temp_path)
+                if temp_stat is not None:
+                    file_size_kb = temp_stat.st_size / 1024
+                    self._info_log.append(f"Extracted audio file: {file_size_kb:.1f} KB")
+                    
+                    # Verify extracted file duration for debugging
+                    try:
+                        actual_extracted_duration = get_extracted_duration(temp_path, stream_info, temp_stat.st_size)
+                        
+                        if actual_extracted_duration is not None:
+                            self._info_log.append(f"Verified extracted file duration: {actual_extracted_duration:.3f}s (requested: {self._precise_duration_seconds:.3f}s)")
+                        else:
+                            self.report({'WARNING'}, f"Could not verify extracted file duration")
+                    except Exception as e:
+                        self.report({'WARNING'}, f"Error verifying extracted file: {e}")
+                    
+                    # Special warning for very small files (likely silent/empty tracks)
+                    if file_size_kb < 10:  # Less than 10KB is suspiciously small for real audio
+                        self.report({'WARNING'}, f"Track {stream_index} ('{stream_title}') extracted file is very small ({file_size_kb:.1f} KB)")
+                        self.report({'WARNING'}, f"This track may be silent/empty but will still be included in the metastrip")
+                    
+                    importable_tracks.append((stream_title, temp_path))
                 else:
-                    extraction_start_channel = 1
-                    self.report({'INFO'}, f"No existing channels found, starting extraction at channel {extraction_start_channel}")
+                    self.report({'WARNING'}, f"Extracted audio file not found: {temp_path}")
+            
+            # Phase 5: Create metastrip from all tracks (80-100% of progress)
+            wm.progress_update(90)
+            
+            if importable_tracks:
+                self._info_log.append(f"Creating metastrip from original strip + {len(importable_tracks)} additional audio tracks...")
+                
+                # Build the metastrip through the data API instead of selecting strips and running meta_make.
+                # It starts out above all existing channels so no existing content is disturbed.
+                _, max_channel = scan_strips(seq_editor)
+                meta_strip = seq_editor.strips.new_meta(
+                    name=f"MultiAudio_{self._original_strip_name}",
+                    channel=max_channel + 1,
+                    frame_start=self._original_frame_start
+                )
                 
                 created_audio_strips = []  # Track all strips we create
-                next_channel = extraction_start_channel
-
-                # Phase 4: Extract and add additional audio tracks to main timeline (30-80% of progress)
-                # Extract the exact duration requested by the user's video strip, since all audio
-                # tracks were recorded simultaneously and should have identical durations.
-                for i, stream_info in enumerate(additional_tracks):
-                    # Update progress for each audio track
-                    audio_progress = 30 + (50 * (i + 1) / len(additional_tracks))
-                    wm.progress_update(audio_progress)
-                    
-                    stream_index = str(stream_info.get("index")) 
-                    stream_tags = stream_info.get("tags", {})
-                    stream_title = stream_tags.get("title", f"Track_{stream_index}")
-                    stream_codec = stream_info.get("codec_name", "unknown")
-
-                    # Use WAV format for universal compatibility instead of AAC
-                    temp_audio_filename = f"additional_audio_{original_strip_name}_track_{stream_index}.wav"
-                    # Save extracted audio next to original video file instead of temp directory
-                    source_dir = os.path.dirname(source_file)
-                    temp_path = os.path.join(source_dir, temp_audio_filename)
-                    
-                    self.report({'INFO'}, f"Extracting additional audio track {stream_index} ('{stream_title}', {stream_codec}) [{i+1}/{len(additional_tracks)}]...")
+                next_channel = self._original_strip_channel + 1  # Stack audio tracks right above the original strip
+                
+                for stream_title, temp_path in importable_tracks:
+                    audio_strip_name = f"Audio_{stream_title}"
                     
-                    try:                        
-                        # Calculate precise duration from original strip's frame count
-                        # Use actual video FPS instead of project FPS for accuracy
-                        precise_duration_seconds = original_frame_final_duration / actual_video_fps
-                        
-                        # Calculate the exact start time in the source file
-                        # This accounts for any trimming/offset the user has applied
-                        strip_start_offset_seconds = original_frame_offset_start / actual_video_fps
-                        
-                        self.report({'INFO'}, f"Strip offsets: frame_offset_start={original_frame_offset_start}, frame_offset_end={original_frame_offset_end}")
-                        self.report({'INFO'}, f"Using precise extraction: start={strip_start_offset_seconds:.3f}s, duration={precise_duration_seconds:.3f}s ({original_frame_final_duration} frames at {actual_video_fps:.2f} FPS)")
-                        
-                        # Extract audio track and convert to WAV PCM for universal compatibility
-                        ffmpeg_command = [
-                            "ffmpeg", "-y", 
-                            "-ss", f"{strip_start_offset_seconds:.6f}",  # Seek BEFORE input for accuracy
-                            "-i", source_file,
-                            "-map", f"0:{stream_index}", 
-                            "-vn",  # No video output
-                            "-acodec", "pcm_s16le",  # Convert to 16-bit PCM for WAV compatibility
-                            "-ar", "48000",  # Standard sample rate
-                            temp_path
-                        ]
-                        
-                        # Debug: Show the exact FFmpeg command
-                        cmd_str = ' '.join(ffmpeg_command)
-                        self.report({'INFO'}, f"FFmpeg command: {cmd_str}")
-                        
-                        stdout, stderr = run_ffmpeg_with_progress(
-                            ffmpeg_command, 
-                            audio_timeout, 
-                            precise_duration_seconds, 
-                            f"Additional Audio Track {i+1}"
-                        )
-                        
-                        if stderr:
-                            self.report({'WARNING'}, f"Failed to extract audio track {stream_index}: {stderr}")
-                            continue
-
-                        # Check the extracted file properties for debugging
-                        if os.path.exists(temp_path):
-                            file_size_kb = os.path.getsize(temp_path) / 1024
-                            self.report({'INFO'}, f"Extracted audio file: {file_size_kb:.1f} KB")
-                            
-                            # Verify extracted file duration with ffprobe for debugging
-                            try:
-                                verify_command = [
-                                    "ffprobe", "-v", "error", 
-                                    "-show_entries", "format=duration",
-                                    "-of", "default=noprint_wrappers=1:nokey=1", temp_path
-                                ]
-                                verify_result = subprocess.run(verify_command, capture_output=True, text=True, check=False, timeout=10)
-                                
-                                if verify_result.returncode == 0 and verify_result.stdout.strip():
-                                    actual_extracted_duration = float(verify_result.stdout.strip())
-                                    self.report({'INFO'}, f"Verified extracted file duration: {actual_extracted_duration:.3f}s (requested: {precise_duration_seconds:.3f}s)")
-                                else:
-                                    self.report({'WARNING'}, f"Could not verify extracted file duration")
-                            except Exception as e:
-                                self.report({'WARNING'}, f"Error verifying extracted file: {e}")
-                            
-                            # Special warning for very small files (likely silent/empty tracks)
-                            if file_size_kb < 10:  # Less than 10KB is suspiciously small for real audio
-                                self.report({'WARNING'}, f"Track {stream_index} ('{stream_title}') extracted file is very small ({file_size_kb:.1f} KB)")
-                                self.report({'WARNING'}, f"This track may be silent/empty but will still be included in the metastrip")
-                        else:
-                            self.report({'WARNING'}, f"Extracted audio file not found: {temp_path}")
-                            continue
-
-                        # Import the extracted audio to safe area on timeline
-                        audio_strip_name = f"Audio_{stream_title}"
-                        
-                        # Create the sound strip in safe extraction area  
-                        audio_strip = seq_editor.strips.new_sound(
+                    try:
+                        # Create the sound strip inside the metastrip, aligned with the original strip
+                        audio_strip = meta_strip.strips.new_sound(
                             name=audio_strip_name,
                             filepath=temp_path,
                             channel=next_channel,
-                            frame_start=temp_extraction_start  # Place in temporary area
+                            frame_start=self._original_frame_start
                         )
                         
                         # Verify the strip was created
                         if audio_strip:
-                            self.report({'INFO'}, f"Created {audio_strip_name}: start={audio_strip.frame_start}, final_start={audio_strip.frame_final_start}, final_end={audio_strip.frame_final_end}, duration={audio_strip.frame_final_duration}")
-                                
+                            self._info_log.append(f"Created {audio_strip_name}: start={audio_strip.frame_start}, final_start={audio_strip.frame_final_start}, final_end={audio_strip.frame_final_end}, duration={audio_strip.frame_final_duration}")
+                            
                             created_audio_strips.append(audio_strip)
-                            self.report({'INFO'}, f"✓ Added {audio_strip_name} on channel {audio_strip.channel} (natural duration: {audio_strip.frame_final_duration} frames)")
+                            self._info_log.append(f"✓ Added {audio_strip_name} on channel {audio_strip.channel} (natural duration: {audio_strip.frame_final_duration} frames)")
                             next_channel += 1
                         else:
                             self.report({'WARNING'}, f"Failed to create audio strip {audio_strip_name}")
                     
                     except Exception as e:
-                        self.report({'WARNING'}, f"Failed to import audio track {stream_index}: {e}")
+                        self.report({'WARNING'}, f"Failed to import audio track {stream_title}: {e}")
                         continue
                 
-                # Phase 5: Create metastrip from all tracks (80-100% of progress)
-                wm.progress_update(90)
-                
                 if created_audio_strips:
-                    self.report({'INFO'}, f"Creating metastrip from original strip + {len(created_audio_strips)} additional audio tracks...")
+                    # Move the original strip into the metastrip, it keeps its position and trimming
+                    selected_strip.move_to_meta(meta_strip)
                     
-                    # First, move original strip to temporary area to group with audio tracks
-                    original_strip_temp_start = temp_extraction_start
-                    selected_strip.frame_start = original_strip_temp_start
-                    selected_strip.channel = extraction_start_channel - 1  # Place original strip just below audio tracks
+                    # Deselect through the data API, an operator would act on the current scene, not this one
+                    for strip in seq_editor.strips_all:
+                        strip.select = False
+                    meta_strip.select = True
+                    seq_editor.active_strip = meta_strip
                     
-                    self.report({'INFO'}, f"Temporarily moved original strip to temporary area for grouping...")
+                    # Phase 6: Restore original position and properties
+                    self._info_log.append(f"Restoring original strip position and properties...")
                     
-                    # Select all strips to include in metastrip (original + all new audio tracks)
-                    bpy.ops.sequencer.select_all(action='DESELECT')
-                    selected_strip.select = True
-                    for audio_strip in created_audio_strips:
-                        audio_strip.select = True
+                    # Move metastrip to original position
+                    meta_strip.frame_start = self._original_frame_start
+                    meta_strip.channel = self._original_strip_channel
                     
-                    # Create metastrip from all selected strips
-                    bpy.ops.sequencer.meta_make()
+                    # Restore original trimming and offset properties
+                    if hasattr(meta_strip, 'frame_offset_start'):
+                        meta_strip.frame_offset_start = self._original_frame_offset_start
+                    if hasattr(meta_strip, 'frame_offset_end'):
+                        meta_strip.frame_offset_end = self._original_frame_offset_end
                     
-                    if seq_editor.active_strip and seq_editor.active_strip.type == 'META':
-                        meta_strip = seq_editor.active_strip
-                        meta_strip.name = f"MultiAudio_{original_strip_name}"
-                        
-                        # Phase 6: Restore original position and properties
-                        self.report({'INFO'}, f"Restoring original strip position and properties...")
-                        
-                        # Move metastrip back to original position
-                        meta_strip.frame_start = original_frame_start
-                        meta_strip.channel = original_strip_channel
-                        
-                        # Restore original trimming and offset properties
-                        if hasattr(meta_strip, 'frame_offset_start'):
-                            meta_strip.frame_offset_start = original_frame_offset_start
-                        if hasattr(meta_strip, 'frame_offset_end'):
-                            meta_strip.frame_offset_end = original_frame_offset_end
-                        
-                        # Ensure final duration matches original (handles trimming)
-                        if hasattr(meta_strip, 'frame_final_duration'):
-                            try:
-                                # Calculate the duration adjustment needed
-                                current_duration = meta_strip.frame_final_duration
-                                target_duration = original_frame_final_duration
-                                if abs(current_duration - target_duration) > 1:  # Allow 1 frame tolerance
-                                    # Adjust end trimming to match original duration
-                                    duration_diff = current_duration - target_duration
-                                    meta_strip.frame_offset_end = original_frame_offset_end + duration_diff
-                                    self.report({'INFO'}, f"Adjusted duration from {current_duration} to {target_duration} frames")
-                            except Exception as duration_error:
-                                self.report({'WARNING'}, f"Could not fully restore duration: {duration_error}")
-                        
-                        self.report({'INFO'}, f"✓ Successfully created metastrip '{meta_strip.name}' containing:")
-                        self.report({'INFO'}, f"  - 1 video track")  
-                        self.report({'INFO'}, f"  - {len(created_audio_strips) + 1} audio tracks")
-                        self.report({'INFO'}, f"✓ All {len(found_audio_streams)} audio tracks successfully grouped!")
-                        self.report({'INFO'}, f"✓ Original position and properties preserved!")
-                        self.report({'INFO'}, f"✓ Timeline safety maintained - no existing content disturbed!")
-                        self.report({'INFO'}, f"✓ Using efficient PCM compression (much smaller files)!")
-                    else:
-                        self.report({'WARNING'}, "Metastrip creation may have failed, but audio tracks were added successfully")
+                    # Ensure final duration matches original (handles trimming)
+                    if hasattr(meta_strip, 'frame_final_duration'):
+                        try:
+                            # Calculate the duration adjustment needed
+                            current_duration = meta_strip.frame_final_duration
+                            target_duration = self._original_frame_final_duration
+                            if abs(current_duration - target_duration) > 1:  # Allow 1 frame tolerance
+                                # Adjust end trimming to match original duration
+                                duration_diff = current_duration - target_duration
+                                meta_strip.frame_offset_end = self._original_frame_offset_end + duration_diff
+                                self._info_log.append(f"Adjusted duration from {current_duration} to {target_duration} frames")
+                        except Exception as duration_error:
+                            self.report({'WARNING'}, f"Could not fully restore duration: {duration_error}")
+                    
+                    self._info_log.append(f"✓ Successfully created metastrip '{meta_strip.name}' containing:")
+                    self._info_log.append(f"  - 1 video track")
+                    self._info_log.append(f"  - {len(created_audio_strips) + 1} audio tracks")
+                    self._info_log.append(f"✓ All {self._found_audio_track_count} audio tracks successfully grouped!")
+                    self._info_log.append(f"✓ Original position and properties preserved!")
+                    self._info_log.append(f"✓ Timeline safety maintained - no existing content disturbed!")
+                    # PCM tracks of untrimmed strips are stream copied to WAV, everything else is FLAC
+                    output_extensions = {os.path.splitext(temp_path)[1] for _, temp_path in importable_tracks}
+                    if ".flac" in output_extensions:
+                        self._info_log.append(f"✓ Using lossless FLAC compression (much smaller files)!")
+                    if ".wav" in output_extensions:
+                        self._info_log.append(f"✓ PCM tracks copied to WAV without re-encoding!")
                 else:
-                    self.report({'WARNING'}, "No additional audio tracks were successfully extracted")
-                
+                    # Nothing to group, don't leave an empty metastrip behind
+                    seq_editor.strips.remove(meta_strip)
+                    self.report({'WARNING'}, "No additional audio tracks could be imported")
             else:
-                # Only one audio track, no need for metastrip
-                self.report({'INFO'}, "Only one audio track found. No additional processing needed.")
+                self.report({'WARNING'}, "No additional audio tracks were successfully extracted")
             
             wm.progress_update(100)
             return {'FINISHED'}
@@ -556,36 +895,46 @@ class AUDIO_OT_ExtractAdditionalTracks(Operator):
             self.report({'ERROR'}, f"Failed to extract additional audio tracks: {e}")
             return {'CANCELLED'}
         finally:
-            # Always end progress bar
-            wm.progress_end()
+            self.end_modal(context)
 
 # Property container
 class MultiAudioProperties(PropertyGroup):
+    __slots__ = ()  # All state lives in RNA properties, instances need no __dict__
+    
     video_path: StringProperty(
         name="Video File",
         description="Path to the video file to import",
         subtype='FILE_PATH'
     )
-    tracks: CollectionProperty(type=AudioTrackItem)  # Kept for compatibility
-    track_index: IntProperty()
 
 # Register/unregister
-classes = (
-    AudioTrackItem,
+_CLASSES: tuple[type, ...] = (
     SEQUENCER_PT_MultiAudioImport,
     AUDIO_OT_ExtractAdditionalTracks,
     MultiAudioProperties,
 )
 
 def register():
-    for cls in classes:
-        bpy.utils.register_class(cls)
+    # Look the binaries up on PATH once instead of on every spawn
+    global _FFMPEG, _FFPROBE
+    _FFMPEG = shutil.which("ffmpeg") or "ffmpeg"
+    _FFPROBE = shutil.which("ffprobe") or "ffprobe"
+    
+    tuple(map(bpy.utils.register_class, _CLASSES))
     bpy.types.Scene.multi_audio_props = bpy.props.PointerProperty(type=MultiAudioProperties)
+    bpy.app.handlers.depsgraph_update_post.append(clear_strip_info_cache)
 
 def unregister():
-    for cls in reversed(classes):
-        bpy.utils.unregister_class(cls)
-    del bpy.types.Scene.multi_audio_props
+    if clear_strip_info_cache in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(clear_strip_info_cache)
+    _STRIP_INFO_CACHE.clear()
+    _cached_probe.cache_clear()
+    
+    # Guarded, so unregistering after a partially failed register() still removes the classes
+    if hasattr(bpy.types.Scene, "multi_audio_props"):
+        del bpy.types.Scene.multi_audio_props
+    
+    tuple(map(bpy.utils.unregister_class, reversed(_CLASSES)))
 
 if __name__ == "__main__":
     register()